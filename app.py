@@ -1,14 +1,12 @@
 import streamlit as st
 import os
-import time
 import threading
 import pandas as pd
-import glob
 import re
 import logging
 from datetime import datetime
 
-from main import Scraper, Storage, WebsiteMonitor, ChangeDetector, ChangeSummarizer
+from main import Scraper, WebsiteMonitor, ChangeDetector, ChangeSummarizer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,8 +25,6 @@ if 'monitor_running' not in st.session_state:
     st.session_state.monitor_running = False
 if 'monitor_thread' not in st.session_state:
     st.session_state.monitor_thread = None
-if 'storage' not in st.session_state:
-    st.session_state.storage = Storage()
 if 'error_message' not in st.session_state:
     st.session_state.error_message = None
 if 'urls' not in st.session_state:
@@ -45,21 +41,32 @@ if 'meaningful_change' not in st.session_state:
 monitor_thread_stop_event = None
 monitor = None
 
-def load_reports():
+_REPORT_RE = re.compile(r'(.+)_changes_(\d{8}_\d{6})(?:_[0-9a-f]{8})?\.html')
+
+def parse_report_timestamp(s: str) -> datetime:
+    # Slicing the fixed '%Y%m%d_%H%M%S' layout is much cheaper than strptime.
+    return datetime(int(s[:4]), int(s[4:6]), int(s[6:8]), int(s[9:11]), int(s[11:13]), int(s[13:15]))
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_reports(dir_mtime_ns: int):
     reports = []
-    for file in glob.glob("*_changes_*.html"):
-        match = re.match(r'(.+)_changes_(\d{8}_\d{6})\.html', file)
-        if match:
-            domain = match.group(1).replace('_', '.')
-            timestamp_str = match.group(2)
-            timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-            reports.append({
-                'domain': domain,
-                'timestamp': timestamp,
-                'filename': file
-            })
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if not entry.name.endswith('.html'):
+                continue
+            match = _REPORT_RE.match(entry.name)
+            if match:
+                reports.append({
+                    'domain': match.group(1).replace('_', '.'),
+                    'timestamp': parse_report_timestamp(match.group(2)),
+                    'filename': entry.name
+                })
     return sorted(reports, key=lambda x: x['timestamp'], reverse=True)
 
+def load_reports():
+    # Creating or deleting a report bumps the directory mtime, which invalidates the cache.
+    return _load_reports(os.stat('.').st_mtime_ns)
+
 def monitor_websites(urls, user_preferences, check_interval, meaningful_change, stop_event):
     monitor = WebsiteMonitor(
         urls=urls,
@@ -70,40 +77,17 @@ def monitor_websites(urls, user_preferences, check_interval, meaningful_change,
     
     try:
         while not stop_event.is_set():
-            for url in urls:
-                if stop_event.is_set():
-                    break
-
-                logging.info(f"Checking {url}")
-                current_hash, current_content = monitor.scraper.fetch(url)
-                stored_data = monitor.storage.get_url_data(url)
-                
-                if not stored_data.get('hash'):
-                    monitor.storage.add_url(url, current_hash, current_content)
-                    continue
-                
-                if current_hash and current_hash != stored_data['hash']:
-                    if meaningful_change:
-                        if monitor.summarizer.is_change_important(url, stored_data['content'], current_content, user_preferences):
-                            logging.info(f"Significant changes detected at {datetime.now()} for {url}")
-                            monitor._generate_report(url, stored_data['content'], current_content)
-                        else:
-                            logging.info(f"Change at {url} deemed insignificant; skipping report.")
-                    else:
-                        logging.info(f"Change detected at {datetime.now()} for {url}")
-                        monitor._generate_report(url, stored_data['content'], current_content)
-                    
-                    monitor.storage.update_url(url, current_hash, current_content)
+            monitor.check_once()
             
-            for _ in range(check_interval * 60):
-                if stop_event.is_set():
-                    break
-                time.sleep(1)
+            if stop_event.wait(timeout=check_interval * 60):
+                break
                 
     except Exception as e:
         logging.error(f"Error in monitoring thread: {e}")
         st.session_state.error_message = str(e)
         st.session_state.monitor_running = False
+    finally:
+        monitor.close()
 
 def start_monitoring():
     global monitor_thread_stop_event
@@ -1,17 +1,28 @@
 import os
 import re
 import time
+import heapq
+import asyncio
 import logging
 import hashlib
 import difflib
+import codecs
+import sqlite3
+import aiohttp
 import requests
-import html
 from bs4 import BeautifulSoup
-from collections import defaultdict
+from charset_normalizer import from_bytes
+from selectolax.lexbor import LexborHTMLParser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from dotenv import load_dotenv
 from urllib.parse import urlparse
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 load_dotenv()
 
@@ -21,28 +32,48 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
+_LINE_BREAK_RE = re.compile(r'[^\S\n]*\n[^\S\n]*')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_UNSAFE_FILENAME_RE = re.compile(r'[\/:]')
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+# Same escaping as html.escape(s, quote=True), done in a single str.translate pass.
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+def fingerprint(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 class DiffCode:
     SIMILAR = 0
     RIGHTONLY = 1
     LEFTONLY = 2
     CHANGED = 3
 
+@dataclass
+class DiffResult:
+    additions: list[str]
+    deletions: list[str]
+    lines: list[str]
+
+@dataclass
+class PageChange:
+    url: str
+    old_content: str
+    new_content: str
+    content_hash: str
+    meta: dict
+    diff: DiffResult
+
 class DifflibParser:
-    def __init__(self, text1: list[str], text2: list[str]):
-        self._diff = list(difflib.unified_diff(
-            text1, text2,
-            fromfile='original', tofile='modified',
-            lineterm=''
-        ))
-        self._current_line = 0
+    def __init__(self, diff: Iterable[str]):
+        self._diff = iter(diff)
 
     def __iter__(self):
         return self
 
     def __next__(self) -> dict:
-        while self._current_line < len(self._diff):
-            line = self._diff[self._current_line]
-            self._current_line += 1
+        for line in self._diff:
             if line.startswith(('---', '+++', '@@')):
                 continue
             code = line[0] if line else ' '
@@ -56,54 +87,191 @@ class DifflibParser:
         raise StopIteration
 
 class Scraper:
+    HEADERS = {'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip, deflate'}
+
+    def __init__(self, pool_size: int = 10):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(self.HEADERS)
+
     @staticmethod
-    def remove_tags(html_content: str) -> str:
+    def _soup_text(html_content: str) -> str:
         soup = BeautifulSoup(html_content, "html.parser")
         for tag in soup.find_all(['br', 'p', 'div', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
             tag.insert_after('\n')
-        text = soup.get_text('\n', strip=True)
-        lines = []
-        for line in text.splitlines():
-            stripped = line.strip()
-            if stripped:
-                lines.append(stripped)
-            elif lines and lines[-1] != '':
-                lines.append('')
-        return '\n'.join(lines)
-
-    def fetch(self, url: str) -> tuple[str, str]:
+        return soup.get_text('\n', strip=True)
+
+    @staticmethod
+    def remove_tags(html_content: str) -> str:
+        try:
+            tree = LexborHTMLParser(html_content)
+            for node in tree.css('script, style, template'):
+                node.decompose()
+            # Walk every text node from <html> down, as get_text('\n', strip=True) does:
+            # this keeps <title> and drops whitespace-only nodes between elements.
+            parts = (node.text_content.strip() for node in tree.root.traverse(include_text=True)
+                     if node.tag == '-text')
+            text = '\n'.join(part for part in parts if part)
+        except Exception as e:
+            logging.warning(f"selectolax could not parse page, falling back to BeautifulSoup: {e}")
+            text = Scraper._soup_text(html_content)
+        # Strip every line and collapse runs of blank lines into one.
+        text = _LINE_BREAK_RE.sub('\n', text.strip())
+        return _BLANK_LINES_RE.sub('\n\n', text)
+
+    @staticmethod
+    def _conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    @staticmethod
+    def _validators(headers) -> dict[str, str | None]:
+        return {'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+
+    @staticmethod
+    def decode(body: bytes, content_type: str | None) -> str:
+        match = _CHARSET_RE.search(content_type or '')
+        if match:
+            try:
+                return body.decode(codecs.lookup(match.group(1)).name, errors='replace')
+            except LookupError:
+                pass
+        best = from_bytes(body).best()
+        return str(best) if best is not None else body.decode('utf-8', errors='replace')
+
+    def _process(self, body: bytes, content_type: str | None) -> tuple[str, str]:
+        # Both fetch paths decode the same way so their snapshots of a page compare equal.
+        text_content = self.remove_tags(self.decode(body, content_type))
+        content_hash = fingerprint(text_content)
+        return content_hash, text_content
+
+    def probe(self, url: str, last_modified: str | None) -> tuple[bool, dict]:
+        try:
+            response = self.session.head(url, timeout=5, allow_redirects=True)
+        except Exception as e:
+            logging.warning(f"HEAD probe failed for {url}: {e}")
+            return True, {}
+        changed = not last_modified or response.headers.get('Last-Modified') != last_modified
+        return changed, response.headers
+
+    def fetch(self, url: str, etag: str | None = None, last_modified: str | None = None,
+              raw_hash: str | None = None) -> tuple[str, str | None, dict]:
+        # A None content means the page is unchanged: either a 304 or identical raw bytes.
         try:
-            response = requests.get(url, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
-            response.encoding = response.apparent_encoding
-            text_content = self.remove_tags(response.text)
-            content_hash = hashlib.sha224(text_content.encode('utf-8')).hexdigest()
-            return content_hash, text_content
+            response = self.session.get(url, timeout=10, headers=self._conditional_headers(etag, last_modified))
+            meta = self._validators(response.headers)
+            if response.status_code == 304:
+                return "", None, meta
+            meta['raw_hash'] = fingerprint(response.content)
+            if meta['raw_hash'] == raw_hash:
+                return "", None, meta
+            content_hash, text_content = self._process(response.content, response.headers.get('Content-Type'))
+            return content_hash, text_content, meta
         except Exception as e:
             logging.error(f"Error fetching {url}: {e}")
-            return "", ""
+            return "", "", {}
+
+    async def fetch_async(self, session: aiohttp.ClientSession, url: str, etag: str | None = None,
+                          last_modified: str | None = None, raw_hash: str | None = None) -> tuple[str, str | None, dict]:
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10),
+                                   headers=self._conditional_headers(etag, last_modified)) as response:
+                meta = self._validators(response.headers)
+                if response.status == 304:
+                    return "", None, meta
+                body = await response.read()
+                meta['raw_hash'] = fingerprint(body)
+                if meta['raw_hash'] == raw_hash:
+                    return "", None, meta
+                content_type = response.headers.get('Content-Type')
+            # Charset detection and HTML parsing are CPU-bound; keep them off the event loop.
+            loop = asyncio.get_running_loop()
+            content_hash, text_content = await loop.run_in_executor(None, self._process, body, content_type)
+            return content_hash, text_content, meta
+        except Exception as e:
+            logging.error(f"Error fetching {url}: {e}")
+            return "", "", {}
 
 class ChangeDetector:
     @staticmethod
-    def get_diff(old_content: str, new_content: str) -> list[str]:
-        old_lines = old_content.split('\n') if old_content else []
-        new_lines = new_content.split('\n') if new_content else []
-        return list(difflib.unified_diff(old_lines, new_lines))
+    def _format_range(start: int, stop: int) -> str:
+        length = stop - start
+        if length == 1:
+            return f'{start + 1}'
+        return f'{start + 1 if length else start},{length}'
 
     @staticmethod
-    def generate_side_by_side_diff(old_content: str, new_content: str) -> str:
+    def iter_diff(old_content: str, new_content: str) -> Iterator[str]:
+        # Same output as difflib.unified_diff(..., fromfile='original', tofile='modified', lineterm=''),
+        # but the matcher compares small ints instead of full line strings.
         old_lines = old_content.split('\n') if old_content else []
         new_lines = new_content.split('\n') if new_content else []
-        parser = DifflibParser(old_lines, new_lines)
-        html_parts = [
-            '<div class="diff-container">',
-            '<table class="diff-table">',
-            '<tr><th>Before</th><th>After</th></tr>'
-        ]
-        for entry in parser:
+        vocab: dict[str, int] = {}
+        old_ids = [vocab.setdefault(line, len(vocab)) for line in old_lines]
+        new_ids = [vocab.setdefault(line, len(vocab)) for line in new_lines]
+        matcher = difflib.SequenceMatcher(None, old_ids, new_ids)
+        started = False
+        for group in matcher.get_grouped_opcodes(3):
+            if not started:
+                started = True
+                yield '--- original'
+                yield '+++ modified'
+            first, last = group[0], group[-1]
+            yield (f'@@ -{ChangeDetector._format_range(first[1], last[2])} '
+                   f'+{ChangeDetector._format_range(first[3], last[4])} @@')
+            for tag, i1, i2, j1, j2 in group:
+                if tag == 'equal':
+                    for line in old_lines[i1:i2]:
+                        yield ' ' + line
+                    continue
+                if tag in ('replace', 'delete'):
+                    for line in old_lines[i1:i2]:
+                        yield '-' + line
+                if tag in ('replace', 'insert'):
+                    for line in new_lines[j1:j2]:
+                        yield '+' + line
+
+    @staticmethod
+    def get_diff(old_content: str, new_content: str) -> list[str]:
+        return list(ChangeDetector.iter_diff(old_content, new_content))
+
+    @staticmethod
+    def compute_diff(old_content: str, new_content: str) -> DiffResult:
+        diff = ChangeDetector.get_diff(old_content, new_content)
+        additions, deletions = [], []
+        # diff[:2] are the ---/+++ file headers.
+        for line in diff[2:]:
+            code = line[:1]
+            if code == '+':
+                additions.append(line[1:])
+            elif code == '-':
+                deletions.append(line[1:])
+        return DiffResult(additions, deletions, diff)
+
+    @staticmethod
+    def generate_side_by_side_diff(old_content: str, new_content: str) -> Iterator[str]:
+        yield from ChangeDetector.iter_side_by_side(ChangeDetector.iter_diff(old_content, new_content))
+
+    @staticmethod
+    def iter_side_by_side(diff: Iterable[str]) -> Iterator[str]:
+        yield '<div class="diff-container">'
+        yield '<table class="diff-table">'
+        yield '<tr><th>Before</th><th>After</th></tr>'
+        for entry in DifflibParser(diff):
             row_class = []
             left_content = '&nbsp;'
             right_content = '&nbsp;'
-            escaped_line = html.escape(entry["line"])
+            escaped_line = entry["line"].translate(_HTML_ESCAPE_TABLE)
             if entry['code'] == DiffCode.LEFTONLY:
                 left_content = f'<span class="diff-remove">{escaped_line}</span>'
                 row_class.append('removed')
@@ -114,133 +282,151 @@ class ChangeDetector:
                 left_content = escaped_line
                 right_content = escaped_line
                 row_class.append('unchanged')
-            html_parts.append(
+            yield (
                 f'<tr class="{" ".join(row_class)}">'
                 f'<td class="left">{left_content}</td>'
                 f'<td class="right">{right_content}</td>'
                 '</tr>'
             )
-        html_parts.extend(['</table>', '</div>'])
-        return '\n'.join(html_parts)
+        yield '</table>'
+        yield '</div>'
 
 class ChangeSummarizer:
+    CACHE_SIZE = 512
+    PROMPT_LINE_BUDGET = 200
+    MIN_CHANGED_CHARS = 80
+
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self._importance_cache: OrderedDict[tuple, bool] = OrderedDict()
+        self._summary_cache: OrderedDict[tuple, str] = OrderedDict()
 
-    def summarize(self, url: str, old_content: str, new_content: str, user_preferences: str) -> str:
-        diff = ChangeDetector.get_diff(old_content, new_content)
-        changes = {
-            'additions': [line[1:] for line in diff if line.startswith('+')],
-            'deletions': [line[1:] for line in diff if line.startswith('-')]
-        }
-        completion = self.client.chat.completions.create(
+    @staticmethod
+    def _cache_key(url: str, old_content: str, new_content: str, user_preferences: str) -> tuple:
+        return url, fingerprint(old_content), fingerprint(new_content), fingerprint(user_preferences)
+
+    def _remember(self, cache: OrderedDict, key: tuple, value):
+        cache[key] = value
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+
+    @classmethod
+    def _budget(cls, lines: list[str]) -> str:
+        if len(lines) <= cls.PROMPT_LINE_BUDGET:
+            return '\n'.join(lines)
+        omitted = len(lines) - cls.PROMPT_LINE_BUDGET
+        return f"[{omitted} earlier lines omitted]\n" + '\n'.join(lines[-cls.PROMPT_LINE_BUDGET:])
+
+    @classmethod
+    def _changes_prompt(cls, diff: DiffResult) -> str:
+        return (
+            f"Removed content:\n{cls._budget(diff.deletions)}\n\n"
+            f"Added content:\n{cls._budget(diff.additions)}"
+        )
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    async def summarize(self, url: str, old_content: str, new_content: str, user_preferences: str,
+                        diff: DiffResult | None = None) -> str:
+        key = self._cache_key(url, old_content, new_content, user_preferences)
+        if key in self._summary_cache:
+            self._summary_cache.move_to_end(key)
+            return self._summary_cache[key]
+        diff = diff or ChangeDetector.compute_diff(old_content, new_content)
+        completion = await self.client.chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": (
                     f"Analyze content changes for {url}. User profile: {user_preferences}. "
                     "Focus on factual changes, ignore formatting. Use concise bullet points."
                 )},
-                {"role": "user", "content": (
-                    f"Removed content:\n{chr(10).join(changes['deletions'])}\n\n"
-                    f"Added content:\n{chr(10).join(changes['additions'])}"
-                )}
+                {"role": "user", "content": self._changes_prompt(diff)}
             ]
         )
-        return completion.choices[0].message.content
+        return self._remember(self._summary_cache, key, completion.choices[0].message.content)
 
-    def is_change_important(self, url: str, old_content: str, new_content: str, user_preferences: str) -> bool:
-        diff = ChangeDetector.get_diff(old_content, new_content)
-        changes = {
-            'additions': [line[1:] for line in diff if line.startswith('+')],
-            'deletions': [line[1:] for line in diff if line.startswith('-')]
-        }
-        response = self.client.chat.completions.create(
-            model="gpt-4o",
+    @classmethod
+    def _is_trivial(cls, diff: DiffResult) -> bool:
+        changed_chars = sum(len(''.join(line.split())) for line in diff.additions + diff.deletions)
+        return changed_chars < cls.MIN_CHANGED_CHARS
+
+    async def is_change_important(self, url: str, old_content: str, new_content: str, user_preferences: str,
+                                  diff: DiffResult | None = None) -> bool:
+        key = self._cache_key(url, old_content, new_content, user_preferences)
+        if key in self._importance_cache:
+            self._importance_cache.move_to_end(key)
+            return self._importance_cache[key]
+        diff = diff or ChangeDetector.compute_diff(old_content, new_content)
+        if self._is_trivial(diff):
+            logging.info(f"Change at {url} is below the significance threshold; skipping LLM check.")
+            return False
+        response = await self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            max_tokens=2,
+            temperature=0,
             messages=[
                 {"role": "system", "content": (
                     f"Determine if the following changes on {url} are important enough to warrant a report. "
                     f"User profile: {user_preferences}. Respond with a single word: 'Yes' or 'No'."
                 )},
-                {"role": "user", "content": (
-                    f"Removed content:\n{chr(10).join(changes['deletions'])}\n\n"
-                    f"Added content:\n{chr(10).join(changes['additions'])}"
-                )}
+                {"role": "user", "content": self._changes_prompt(diff)}
             ]
         )
         answer = response.choices[0].message.content.strip().lower()
         logging.info(f"False positive check answer: {answer}")
-        return 'yes' in answer
+        return self._remember(self._importance_cache, key, 'yes' in answer)
 
 class Storage:
-    def __init__(self):
-        self.data: dict[str, dict] = defaultdict(dict)
-
-    def add_url(self, url: str, content_hash: str, content: str) -> None:
-        self.data[url].update({
-            'hash': content_hash,
-            'content': content,
-            'timestamp': datetime.now().isoformat()
-        })
+    def __init__(self, path: str = 'sitespy.db'):
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls ("
+            "url TEXT PRIMARY KEY, hash TEXT, content TEXT, etag TEXT, "
+            "last_modified TEXT, raw_hash TEXT, timestamp TEXT, "
+            "next_check_ts REAL, miss_streak INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(urls)")}
+        if 'next_check_ts' not in columns:
+            self.conn.execute("ALTER TABLE urls ADD COLUMN next_check_ts REAL")
+        if 'miss_streak' not in columns:
+            self.conn.execute("ALTER TABLE urls ADD COLUMN miss_streak INTEGER NOT NULL DEFAULT 0")
 
-    def get_url_data(self, url: str) -> dict:
-        return self.data.get(url, {})
+    def add_url(self, url: str, content_hash: str, content: str, etag: str | None = None,
+                last_modified: str | None = None, raw_hash: str | None = None) -> None:
+        self.conn.execute(
+            "INSERT INTO urls (url, hash, content, etag, last_modified, raw_hash, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET hash = excluded.hash, content = excluded.content, "
+            "etag = excluded.etag, last_modified = excluded.last_modified, "
+            "raw_hash = excluded.raw_hash, timestamp = excluded.timestamp",
+            (url, content_hash, content, etag, last_modified, raw_hash, datetime.now().isoformat())
+        )
 
-    def update_url(self, url: str, content_hash: str, content: str) -> None:
-        self.add_url(url, content_hash, content)
+    def set_schedule(self, url: str, next_check_ts: float, miss_streak: int) -> None:
+        self.conn.execute(
+            "INSERT INTO urls (url, next_check_ts, miss_streak) VALUES (?, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET next_check_ts = excluded.next_check_ts, "
+            "miss_streak = excluded.miss_streak",
+            (url, next_check_ts, miss_streak)
+        )
 
-class WebsiteMonitor:
-    def __init__(self, urls: list[str], user_preferences: str, check_interval: int, meaningful_change: bool = True):
-        self.urls = urls
-        self.user_preferences = user_preferences
-        self.check_interval = check_interval
-        self.meaningful_change = meaningful_change
-        self.scraper = Scraper()
-        self.storage = Storage()
-        self.summarizer = ChangeSummarizer()
-        self._initialize_storage()
+    def get_url_data(self, url: str) -> dict:
+        row = self.conn.execute("SELECT * FROM urls WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else {}
 
-    def _initialize_storage(self) -> None:
-        for url in self.urls:
-            content_hash, content = self.scraper.fetch(url)
-            if content_hash:
-                self.storage.add_url(url, content_hash, content)
-            else:
-                logging.warning(f"Initial fetch failed for {url}")
+    def close(self) -> None:
+        self.conn.close()
 
-    def run(self) -> None:
-        try:
-            while True:
-                for url in self.urls:
-                    logging.info(f"Checking {url}")
-                    current_hash, current_content = self.scraper.fetch(url)
-                    stored_data = self.storage.get_url_data(url)
-                    if not stored_data.get('hash'):
-                        self.storage.add_url(url, current_hash, current_content)
-                        continue
-                    if current_hash and current_hash != stored_data['hash']:
-                        if self.meaningful_change:
-                            if self.summarizer.is_change_important(url, stored_data['content'], current_content, self.user_preferences):
-                                logging.info(f"Significant changes detected at {datetime.now()} for {url}")
-                                self._generate_report(url, stored_data['content'], current_content)
-                            else:
-                                logging.info(f"Change at {url} deemed insignificant; skipping report.")
-                        else:
-                            logging.info(f"Change detected at {datetime.now()} for {url} (false positive check disabled)")
-                            self._generate_report(url, stored_data['content'], current_content)
-                        self.storage.update_url(url, current_hash, current_content)
-                time.sleep(self.check_interval * 60)
-        except KeyboardInterrupt:
-            logging.info("Website monitoring stopped by user.")
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
+    def update_url(self, url: str, content_hash: str, content: str, etag: str | None = None,
+                   last_modified: str | None = None, raw_hash: str | None = None) -> None:
+        self.add_url(url, content_hash, content, etag, last_modified, raw_hash)
 
-    def _generate_report(self, url: str, old_content: str, new_content: str) -> None:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.replace('www.', '')
-        safe_domain = re.sub(r'[\/:]', '_', domain)
-        report_filename = f"{safe_domain}_changes_{timestamp}.html"
-        report_html = f'''<!DOCTYPE html>
+REPORT_HEAD = '''<!DOCTYPE html>
 <html>
 <head>
     <title>Change Report - {url}</title>
@@ -295,19 +481,198 @@ class WebsiteMonitor:
 </head>
 <body>
     <h1>Website Change Report</h1>
-    <h2>{url} <span class="timestamp">({datetime.now().strftime('%Y-%m-%d %H:%M')})</span></h2>
-    <h3>Summary of Changes</h3>
-    <div class="summary">{self.summarizer.summarize(url, old_content, new_content, self.user_preferences)}</div>
-    <h3>Detailed Comparison</h3>
-    {ChangeDetector.generate_side_by_side_diff(old_content, new_content)}
-</body>
-</html>'''
+    <h2>{url} <span class="timestamp">({generated})</span></h2>
+'''
+
+class WebsiteMonitor:
+    MAX_BACKOFF_EXPONENT = 6
+
+    def __init__(self, urls: list[str], user_preferences: str, check_interval: int, meaningful_change: bool = True):
+        self.urls = list(dict.fromkeys(urls))
+        self.user_preferences = user_preferences
+        self.check_interval = check_interval
+        self.meaningful_change = meaningful_change
+        self.scraper = Scraper(pool_size=max(len(self.urls), 1))
+        self.storage = Storage()
+        self.summarizer = ChangeSummarizer()
+        # One loop for the monitor's lifetime: the AsyncOpenAI and aiohttp connection pools are bound to it.
+        self._loop = asyncio.new_event_loop()
+        self._session: aiohttp.ClientSession | None = None
+        self._initialize_storage()
+        # Min-heap of (next_check_ts, url); unchanged pages are polled less and less often.
+        self._schedule = [(self._seed_check_ts(url), url) for url in self.urls]
+        heapq.heapify(self._schedule)
+
+    def _initialize_storage(self) -> None:
+        urls = [url for url in self.urls if not self.storage.get_url_data(url).get('hash')]
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(urls))) as executor:
+            results = list(executor.map(self.scraper.fetch, urls))
+        for url, (content_hash, content, meta) in zip(urls, results):
+            if content_hash:
+                self.storage.add_url(url, content_hash, content, **meta)
+            else:
+                logging.warning(f"Initial fetch failed for {url}")
+
+    def check_once(self) -> None:
+        self._loop.run_until_complete(self._check_all())
+
+    def close(self) -> None:
         try:
-            with open(report_filename, 'w', encoding='utf-8') as f:
-                f.write(report_html)
-            logging.info(f"Generated report: {report_filename}")
+            if self._session is not None:
+                self._loop.run_until_complete(self._session.close())
+            self._loop.run_until_complete(self.summarizer.close())
+            self._loop.close()
+        finally:
+            self.storage.close()
+
+    def _due_urls(self) -> list[str]:
+        now = time.time()
+        due = []
+        while self._schedule and self._schedule[0][0] <= now:
+            due.append(heapq.heappop(self._schedule)[1])
+        return due
+
+    def _backoff_interval(self, miss_streak: int) -> float:
+        return self.check_interval * 60 * 2 ** min(miss_streak, self.MAX_BACKOFF_EXPONENT)
+
+    def _seed_check_ts(self, url: str) -> float:
+        stored_data = self.storage.get_url_data(url)
+        # The stored time may come from a run with a longer check_interval; cap it at the current backoff.
+        return min(stored_data.get('next_check_ts') or 0.0,
+                   time.time() + self._backoff_interval(stored_data.get('miss_streak', 0)))
+
+    def _reschedule(self, url: str, changed: bool, failed: bool = False) -> None:
+        miss_streak = self.storage.get_url_data(url).get('miss_streak', 0)
+        if failed:
+            # A failed fetch says nothing about the page: keep the streak and retry at the base interval.
+            next_check_ts = time.time() + self._backoff_interval(0)
+        else:
+            miss_streak = 0 if changed else miss_streak + 1
+            next_check_ts = time.time() + self._backoff_interval(miss_streak)
+        self.storage.set_schedule(url, next_check_ts, miss_streak)
+        heapq.heappush(self._schedule, (next_check_ts, url))
+
+    async def _check_all(self) -> None:
+        urls = self._due_urls()
+        if not urls:
+            return
+        if self._session is None:
+            # Created inside the running loop and kept so keep-alive connections survive between cycles.
+            self._session = aiohttp.ClientSession(headers=Scraper.HEADERS)
+        results = await asyncio.gather(
+            *(self._fetch(self._session, url) for url in urls),
+            return_exceptions=True
+        )
+        changes = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logging.error(f"Error fetching {url}: {result}")
+                change, failed = None, True
+            else:
+                change = self._check_url(url, *result)
+                # Scraper signals a failed fetch with an empty hash alongside non-None content.
+                failed = not result[0] and result[1] is not None
+            if change:
+                changes.append(change)
+            self._reschedule(url, changed=change is not None, failed=failed)
+        if changes:
+            await self._handle_changes(changes)
+
+    async def _handle_changes(self, changes: list[PageChange]) -> None:
+        if self.meaningful_change:
+            decisions = await asyncio.gather(
+                *(self.summarizer.is_change_important(
+                    change.url, change.old_content, change.new_content, self.user_preferences, change.diff
+                ) for change in changes),
+                return_exceptions=True
+            )
+        else:
+            decisions = [True] * len(changes)
+        reports = []
+        for change, important in zip(changes, decisions):
+            if isinstance(important, Exception):
+                logging.error(f"Error checking change importance for {change.url}: {important}")
+                continue
+            if not self.meaningful_change:
+                logging.info(f"Change detected at {datetime.now()} for {change.url} (false positive check disabled)")
+                reports.append(change)
+            elif important:
+                logging.info(f"Significant changes detected at {datetime.now()} for {change.url}")
+                reports.append(change)
+            else:
+                logging.info(f"Change at {change.url} deemed insignificant; skipping report.")
+                self.storage.update_url(change.url, change.content_hash, change.new_content, **change.meta)
+        results = await asyncio.gather(
+            *(self._generate_report(change.url, change.old_content, change.new_content, change.diff)
+              for change in reports),
+            return_exceptions=True
+        )
+        for change, result in zip(reports, results):
+            if isinstance(result, Exception):
+                # Keep the old content so the change is detected and reported again next cycle.
+                logging.error(f"Error generating report for {change.url}: {result}")
+            else:
+                self.storage.update_url(change.url, change.content_hash, change.new_content, **change.meta)
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> tuple[str, str | None, dict]:
+        stored_data = self.storage.get_url_data(url)
+        etag, last_modified = stored_data.get('etag'), stored_data.get('last_modified')
+        # Without a strong ETag, a HEAD comparing Last-Modified is cheaper than a full GET.
+        if last_modified and (not etag or etag.startswith('W/')):
+            loop = asyncio.get_running_loop()
+            changed, headers = await loop.run_in_executor(None, self.scraper.probe, url, last_modified)
+            if not changed:
+                return "", None, Scraper._validators(headers)
+        return await self.scraper.fetch_async(session, url, etag, last_modified, stored_data.get('raw_hash'))
+
+    def _check_url(self, url: str, current_hash: str, current_content: str | None, meta: dict) -> PageChange | None:
+        logging.info(f"Checking {url}")
+        if current_content is None:
+            logging.info(f"{url} not modified since last check.")
+            return None
+        stored_data = self.storage.get_url_data(url)
+        if not stored_data.get('hash'):
+            self.storage.add_url(url, current_hash, current_content, **meta)
+            return None
+        if current_hash and current_hash != stored_data['hash']:
+            diff = ChangeDetector.compute_diff(stored_data['content'], current_content)
+            return PageChange(url, stored_data['content'], current_content, current_hash, meta, diff)
+        if current_hash and any(stored_data.get(key) != value for key, value in meta.items()):
+            self.storage.update_url(url, current_hash, current_content, **meta)
+        return None
+
+    def run(self) -> None:
+        try:
+            while True:
+                self.check_once()
+                time.sleep(self.check_interval * 60)
+        except KeyboardInterrupt:
+            logging.info("Website monitoring stopped by user.")
         except Exception as e:
-            logging.error(f"Error writing report {report_filename}: {e}")
+            logging.error(f"Unexpected error: {e}")
+        finally:
+            self.close()
+
+    async def _generate_report(self, url: str, old_content: str, new_content: str, diff: DiffResult | None = None) -> None:
+        diff = diff or ChangeDetector.compute_diff(old_content, new_content)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        parsed_url = urlparse(url)
+        domain = parsed_url.netloc.replace('www.', '')
+        safe_domain = _UNSAFE_FILENAME_RE.sub('_', domain)
+        # Reports for one host can be written in the same second; the URL digest keeps them apart.
+        report_filename = f"{safe_domain}_changes_{timestamp}_{fingerprint(url)[:8]}.html"
+        summary = await self.summarizer.summarize(url, old_content, new_content, self.user_preferences, diff)
+        with open(report_filename, 'w', encoding='utf-8') as f:
+            f.write(REPORT_HEAD.format(url=url, generated=datetime.now().strftime('%Y-%m-%d %H:%M')))
+            f.write(f'    <h3>Summary of Changes</h3>\n    <div class="summary">{summary}</div>\n')
+            f.write('    <h3>Detailed Comparison</h3>\n')
+            for part in ChangeDetector.iter_side_by_side(diff.lines):
+                f.write(part)
+                f.write('\n')
+            f.write('</body>\n</html>')
+        logging.info(f"Generated report: {report_filename}")
 
 if __name__ == "__main__":
     monitor = WebsiteMonitor(
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import aiohttp
+
+from main import ChangeDetector, ChangeSummarizer, Scraper
+
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>My Title</title>
+    <style>body { color: red; }</style>
+    <script>var tracking = 1;</script>
+</head>
+<body>
+    <h1>Hello</h1>
+    <p>Some <b>bold</b> text</p>
+    <template><p>Hidden template</p></template>
+    <ul>
+        <li>One</li>
+        <li>Two</li>
+    </ul>
+</body>
+</html>"""
+
+
+def test_remove_tags_extracts_visible_text():
+    assert Scraper.remove_tags(SAMPLE_PAGE) == 'My Title\nHello\nSome\nbold\ntext\nOne\nTwo'
+
+
+def test_remove_tags_matches_beautifulsoup_fallback():
+    assert Scraper.remove_tags(SAMPLE_PAGE) == Scraper._soup_text(SAMPLE_PAGE)
+
+
+def test_small_change_on_large_page_is_not_trivial():
+    old = '\n'.join(f'Paragraph {i} of an ordinary news front page.' for i in range(2000))
+    new = old.replace(
+        'Paragraph 1000 of',
+        'BREAKING: Company announces acquisition of its largest rival; CEO resigns effective immediately amid board review\nParagraph 1000 of'
+    )
+    assert not ChangeSummarizer._is_trivial(ChangeDetector.compute_diff(old, new))
+
+
+def test_whitespace_only_change_is_trivial():
+    assert ChangeSummarizer._is_trivial(ChangeDetector.compute_diff('a\nb c', 'a\nb   c'))
+
+
+LATIN1_PAGE = (
+    '<html><head><meta charset="windows-1252"><title>Caf\u00e9 cr\u00e8me</title></head>'
+    '<body><p>R\u00e9sum\u00e9 des \u00e9v\u00e9nements \u00e0 la une, d\u00e9j\u00e0 mis \u00e0 jour.</p></body></html>'
+).encode('cp1252')
+
+
+class _Latin1Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(LATIN1_PAGE)))
+        self.end_headers()
+        self.wfile.write(LATIN1_PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sync_and_async_fetch_decode_alike():
+    server = HTTPServer(('127.0.0.1', 0), _Latin1Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/'
+    scraper = Scraper()
+
+    async def fetch_async():
+        async with aiohttp.ClientSession() as session:
+            return await scraper.fetch_async(session, url)
+
+    try:
+        sync_hash, sync_text, _ = scraper.fetch(url)
+        async_hash, async_text, _ = asyncio.run(fetch_async())
+    finally:
+        server.shutdown()
+    assert sync_text == async_text
+    assert sync_hash == async_hash
+    assert 'Caf\u00e9' in sync_text
+
+
+def test_decode_prefers_header_charset():
+    assert Scraper.decode('caf\u00e9'.encode('cp1252'), 'text/html; charset=windows-1252') == 'caf\u00e9'